@@ -2,10 +2,14 @@ import numpy as np
 from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                              QWidget, QFileDialog, QMessageBox, QSlider, QLabel,
                              QHBoxLayout, QProgressBar, QFrame, QSplitter, QSizePolicy)
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal, QObject
 from PySide6.QtCore import Qt
-from scipy.fft import fft, ifft, fftfreq
+import scipy.fft
+from scipy.fft import rfft, irfft, rfftfreq, next_fast_len
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from scipy.io import wavfile
 import sounddevice as sd
 from PySide6.QtGui import QIcon
@@ -13,8 +17,49 @@ from PySide6.QtCore import Qt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Todas las FFT del programa pasan por scipy.fft (no usar numpy.fft): así
+# comparten un mismo backend y una misma caché de planes.
+# Backend opcional: si pyFFTW está instalado, las FFT de scipy.fft pasan a
+# ejecutarse con FFTW y sus planes se guardan en caché entre llamadas con
+# la misma forma. Sin pyFFTW se usa pocketfft, el backend por defecto.
+try:
+    import pyfftw.interfaces.scipy_fft
+    pyfftw.interfaces.cache.enable()
+    # Por defecto la caché descarta un plan a los 0.1 s sin usarlo; entre
+    # dos clics del usuario pasa mucho más, así que se conservan 5 minutos
+    pyfftw.interfaces.cache.set_keepalive_time(300)
+    scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+except ImportError:
+    pass
+
+# Función para obtener el primer bin de la rfft por encima del umbral
+def bin_de_corte(n, sr, umbral):
+    """
+    Devuelve el índice del primer bin de la rfft (de longitud n) cuya
+    frecuencia supera el umbral. En la rfft las frecuencias crecen con el
+    índice, así que todo lo que está por encima del umbral es un bloque
+    contiguo y no hace falta construir una máscara.
+    """
+    return min(max(int(umbral * n / sr) + 1, 0), n // 2 + 1)
+
+# Función para obtener la rampa de transición del filtro
+@lru_cache(maxsize=8)
+def rampa_coseno(m):
+    """
+    Devuelve m valores que bajan de 1 a 0 siguiendo medio periodo de coseno.
+    Aplicada a los bins justo por debajo del corte evita el corte abrupto en
+    frecuencia, que en el tiempo se oye como oscilaciones (ringing).
+    
+    Solo depende de m, que no cambia mientras se repite el filtro sobre el
+    mismo audio, así que se guarda en caché. Se devuelve en float32 para no
+    promocionar el espectro complex64 y de solo lectura para proteger la caché.
+    """
+    rampa = (0.5 * (1 + np.cos(np.linspace(0, np.pi, m + 2)[1:-1]))).astype(np.float32)
+    rampa.flags.writeable = False
+    return rampa
+
 # Función para filtrar ruido de una señal de audio usando FFT
-def filtrar_ruido(y, sr, umbral=5000):
+def filtrar_ruido(y, sr, umbral=5000, espectro=None, trabajo=None, transicion=200):
     """
     Esta función se encarga de limpiar el ruido de una señal de audio.
     Usa la transformada de Fourier para convertir la señal al dominio de frecuencia,
@@ -25,22 +70,52 @@ def filtrar_ruido(y, sr, umbral=5000):
     - y: señal de audio
     - sr: frecuencia de muestreo
     - umbral: frecuencia de corte para el filtro (por defecto 5000 Hz)
+    - espectro: rfft de y ya calculada (opcional, ver AudioProcessor.espectro)
+    - trabajo: buffer complejo del tamaño del espectro donde copiarlo (opcional)
+    - transicion: ancho en Hz de la caída suave hasta el umbral (por defecto 200 Hz)
     """
     if y is None:
         return None
         
-    # Aplicar FFT para obtener la representación en frecuencia
-    fft_y = fft(y)
-    frecuencias = fftfreq(len(y), 1/sr)
+    # Aplicar FFT real: la señal es real, basta con la mitad no redundante del espectro.
+    # Se rellena hasta un tamaño rápido para la FFT y se usan todos los núcleos
+    n = next_fast_len(len(y))
+    if espectro is None:
+        fft_y = rfft(y, n=n, workers=-1)
+    elif trabajo is None:
+        # Copiar el espectro precalculado para no alterar la caché
+        fft_y = espectro.copy()
+    else:
+        np.copyto(trabajo, espectro)
+        fft_y = trabajo
     
-    # Filtrar frecuencias altas (ruido)
-    mascara = np.abs(frecuencias) > umbral
-    fft_y[mascara] = 0
+    # Atenuar suavemente la banda de transición y anular las frecuencias altas (ruido)
+    aplicar_corte(fft_y, n, sr, umbral, transicion)
     
-    # Aplicar la inversa de Fourier
-    y_filtrado = ifft(fft_y).real
+    # Aplicar la inversa de Fourier (devuelve directamente una señal real).
+    # fft_y ya no se necesita, así que pocketfft puede usarlo como memoria de trabajo
+    y_filtrado = irfft(fft_y, n=n, workers=-1, overwrite_x=True)[:len(y)]
     return y_filtrado
 
+# Función para aplicar el corte paso bajo a un espectro, sobre el propio array
+def aplicar_corte(fft_y, n, sr, umbral, transicion=200):
+    """
+    Atenúa con la rampa de coseno la banda de transición por debajo del
+    umbral y anula el resto del espectro con una sola asignación contigua.
+    
+    La transición queda entera por debajo del umbral: las frecuencias entre
+    umbral - transicion y umbral ya se atenúan, y por encima del umbral no
+    pasa nada. Si el umbral está en Nyquist o por encima no hay nada que
+    quitar y el espectro se deja tal cual.
+    """
+    corte = bin_de_corte(n, sr, umbral)
+    if corte == n // 2 + 1:
+        return
+    inicio = max(0, corte - int(transicion * n / sr))
+    if corte > inicio:
+        fft_y[inicio:corte] *= rampa_coseno(corte - inicio)
+    fft_y[corte:] = 0
+
 # Función para sintetizar un sonido de una frecuencia específica
 def sintetizar_sonido(frecuencia, duracion=2, sr=44100):
     """
@@ -52,21 +127,144 @@ def sintetizar_sonido(frecuencia, duracion=2, sr=44100):
     - duracion: duración en segundos
     - sr: frecuencia de muestreo (calidad del audio)
     """
-    t = np.linspace(0, duracion, int(sr * duracion), endpoint=False)
-    y_sintetizado = 0.5 * np.sin(2 * np.pi * frecuencia * t)
+    # La fase (en ciclos) se calcula en float64 y se reduce a [0, 1) antes de
+    # pasar a float32: multiplicar el índice en float32 acumula un error que
+    # crece con la duración y en audios largos llega a oírse como ruido.
+    # Se trabaja por bloques para que el float64 sea un buffer pequeño y la
+    # única reserva del tamaño del audio sea la salida float32
+    n = int(sr * duracion)
+    y_sintetizado = np.empty(n, dtype=np.float32)
+    bloque = 1 << 16
+    fase = np.empty(min(n, bloque), dtype=np.float64)
+    for inicio in range(0, n, bloque):
+        f = fase[:min(bloque, n - inicio)]
+        f[:] = np.arange(inicio, inicio + len(f))
+        f *= frecuencia / sr
+        np.mod(f, 1.0, out=f)
+        f *= 2 * np.pi
+        # Único paso a float32: el seno escribe directamente en la salida
+        np.sin(f, out=y_sintetizado[inicio:inicio + len(f)])
+    y_sintetizado *= np.float32(0.5)
     return y_sintetizado, sr
 
 # Función para comprimir audio eliminando componentes de frecuencia
-def comprimir_audio(y, porcentaje=50):
+def comprimir_audio(y, porcentaje=50, espectro=None):
+    """
+    Comprime la señal conservando solo el porcentaje de coeficientes de
+    Fourier de mayor magnitud y anulando el resto.
+    
+    Parámetros:
+    - y: señal de audio
+    - porcentaje: porcentaje de coeficientes que se conservan
+    - espectro: rfft de y ya calculada (opcional, ver AudioProcessor.espectro)
+    """
     if y is None:
         return None
         
-    fft_y = fft(y)
-    umbral = int(len(fft_y) * porcentaje / 100)
-    fft_y[umbral:] = 0  # Mantener solo el porcentaje seleccionado de componentes
-    y_comprimido = ifft(fft_y).real
+    n = next_fast_len(len(y))
+    if espectro is None:
+        espectro = rfft(y, n=n, workers=-1)
+    indices = indices_mayores(np.abs(espectro), porcentaje)
+    fft_y = np.zeros_like(espectro)
+    fft_y[indices] = espectro[indices]
+    y_comprimido = irfft(fft_y, n=n, workers=-1, overwrite_x=True)[:len(y)]
     return y_comprimido
 
+# Función para elegir los coeficientes que sobreviven a la compresión
+def indices_mayores(magnitud, porcentaje):
+    """
+    Devuelve los índices del porcentaje de coeficientes de mayor magnitud.
+    argpartition los selecciona en tiempo lineal, sin ordenar el espectro.
+    """
+    k = max(1, int(len(magnitud) * porcentaje / 100))
+    return np.argpartition(magnitud, -k)[-k:]
+
+# Función para calcular los espectros que muestra la vista de compresión
+def espectro_comprimido(y, sr, porcentaje=50, espectro=None):
+    """
+    Comprime el espectro de la señal y devuelve los datos para graficarlo:
+    (frecuencias, magnitud original, magnitud comprimida, espectro comprimido).
+    No aplica la transformada inversa, así la vista puede mostrar los
+    espectros mientras reconstruir_senal recupera la señal comprimida.
+    """
+    n = next_fast_len(len(y))
+    if espectro is None:
+        espectro = rfft(y, n=n, workers=-1)
+    frecuencias = rfftfreq(n, 1/sr)
+    
+    # Aplicar compresión conservando los coeficientes de mayor magnitud
+    magnitud = np.abs(espectro)
+    indices = indices_mayores(magnitud, porcentaje)
+    fft_comprimido = np.zeros_like(espectro)
+    fft_comprimido[indices] = espectro[indices]
+    magnitud_comprimida = np.zeros_like(magnitud)
+    magnitud_comprimida[indices] = magnitud[indices]
+    return frecuencias, magnitud, magnitud_comprimida, fft_comprimido
+
+# Función para volver al dominio del tiempo desde un espectro rellenado
+def reconstruir_senal(espectro, longitud):
+    """
+    Aplica la rfft inversa a un espectro calculado con n=next_fast_len(longitud)
+    y recorta el relleno. El espectro se usa como memoria de trabajo, así que
+    no debe reutilizarse después.
+    """
+    n = next_fast_len(longitud)
+    return irfft(espectro, n=n, workers=-1, overwrite_x=True)[:longitud]
+
+# Función para reducir los puntos que se envían a matplotlib
+def decimar_para_grafica(datos, eje_x=None, objetivo=4000):
+    """
+    Reduce los datos a una envolvente de unos 'objetivo' puntos: cada grupo
+    de muestras consecutivas se resume en su mínimo y su máximo, de modo que
+    los picos se siguen viendo. La pantalla no puede mostrar más detalle y
+    matplotlib tarda en proporción al número de vértices.
+    
+    Parámetros:
+    - datos: valores a graficar
+    - eje_x: valores del eje horizontal (por defecto, el índice de muestra)
+    - objetivo: número aproximado de puntos a conservar (unos dos por píxel)
+    
+    Devuelve (x, y) listos para ax.plot.
+    """
+    columnas = objetivo // 2
+    if len(datos) <= objetivo or columnas == 0:
+        return (np.arange(len(datos)) if eje_x is None else eje_x), datos
+    
+    # Inicios de bloque repartidos sobre todo el array: los bloques difieren
+    # como mucho en una muestra y no se descarta ninguna muestra del final
+    inicios = np.linspace(0, len(datos), columnas + 1)[:-1].astype(np.intp)
+    y = np.empty(2 * columnas, dtype=datos.dtype)
+    y[0::2] = np.minimum.reduceat(datos, inicios)
+    y[1::2] = np.maximum.reduceat(datos, inicios)
+    x = np.repeat(inicios if eje_x is None else eje_x[inicios], 2)
+    return x, y
+
+# Función para mostrar una duración como minutos:segundos
+def formatear_tiempo(segundos):
+    segundos = int(segundos)
+    return f"{segundos // 60}:{segundos % 60:02d}"
+
+# Función para garantizar un buffer contiguo y alineado antes de la FFT
+def alinear(x, alineacion=64, dtype=np.float32):
+    """
+    Devuelve x como array 1D contiguo de tipo dtype cuya dirección es múltiplo
+    de 'alineacion' bytes. Si ya cumple las tres condiciones no copia nada.
+    """
+    if x.dtype == dtype and x.flags.c_contiguous and x.ctypes.data % alineacion == 0:
+        return x
+    itemsize = np.dtype(dtype).itemsize
+    buffer = np.empty(x.shape[0] + alineacion // itemsize, dtype=dtype)
+    desplazamiento = (-buffer.ctypes.data) % alineacion // itemsize
+    salida = buffer[desplazamiento:desplazamiento + x.shape[0]]
+    salida[:] = x
+    return salida
+
+# Factores para normalizar a [-1, 1] las muestras enteras de un WAV
+ESCALAS_WAV = {
+    np.int16: np.float32(1 / 32768.0),
+    np.int32: np.float32(1 / 2147483648.0),
+}
+
 # Clase para procesar archivos de audio
 class AudioProcessor:
     """
@@ -82,6 +280,63 @@ class AudioProcessor:
         """
         self.y = None
         self.sr = None
+        # Caché del espectro como par (señal, rfft) en un solo atributo, para
+        # que otro hilo nunca vea la señal de un archivo con el espectro de otro
+        self._cache_espectro = None
+        self._lock_espectro = threading.Lock()
+        # Buffer de trabajo reutilizado entre filtrados de la misma señal
+        self._trabajo = None
+        self._lock_trabajo = threading.Lock()
+
+    # Método para obtener el espectro de la señal cargada
+    def espectro(self, y=None):
+        """
+        Devuelve la rfft de la señal cargada (rellenada a next_fast_len).
+        Se calcula una sola vez por archivo, así filtrar y comprimir
+        repetidamente no vuelve a transformar la misma señal.
+        
+        Las tareas en segundo plano deben pasar en 'y' la señal que tomaron
+        al encargarse: si mientras tanto se carga otro archivo, el espectro
+        sigue correspondiendo a esa señal y no al archivo nuevo.
+        
+        Puede llamarse desde varios hilos a la vez: el cálculo se hace bajo un
+        lock, así quien pide el espectro mientras otro hilo lo está calculando
+        (por ejemplo, el precálculo al cargar) espera a ese resultado en lugar
+        de lanzar una segunda FFT que compita por los mismos núcleos.
+        """
+        if y is None:
+            y = self.y
+        if y is None:
+            return None
+        cache = self._cache_espectro
+        if cache is not None and cache[0] is y:
+            return cache[1]
+        if y is not self.y:
+            # Señal que ya no está cargada: calcularla sin desplazar la caché
+            return rfft(y, n=next_fast_len(len(y)), workers=-1)
+        with self._lock_espectro:
+            cache = self._cache_espectro
+            if cache is None or cache[0] is not y:
+                cache = (y, rfft(y, n=next_fast_len(len(y)), workers=-1))
+                self._cache_espectro = cache
+            return cache[1]
+
+    # Método para filtrar la señal cargada
+    def filtrar(self, y, sr, umbral=5000):
+        """
+        Aplica filtrar_ruido a la señal y partiendo del espectro en caché y de
+        un buffer de trabajo que solo se reserva de nuevo cuando cambia la
+        longitud del audio.
+        
+        y y sr se leen en el hilo de la interfaz al encargar la tarea: si
+        mientras tanto se carga otro archivo, se filtra la señal que había.
+        """
+        espectro = self.espectro(y)
+        with self._lock_trabajo:
+            if self._trabajo is None or self._trabajo.shape != espectro.shape:
+                self._trabajo = np.empty_like(espectro)
+            return filtrar_ruido(y, sr, umbral, espectro=espectro,
+                                 trabajo=self._trabajo)
 
     # Método para cargar un archivo de audio WAV
     def cargar_audio(self):
@@ -100,16 +355,30 @@ class AudioProcessor:
             if archivo_audio:
                 try:
                     self.sr, data = wavfile.read(archivo_audio)
-                    # Convertir a float y normalizar
-                    self.y = data.astype(float)
-                    if data.dtype == np.int16:
-                        self.y /= 32768.0
-                    elif data.dtype == np.int32:
-                        self.y /= 2147483648.0
+                    self._cache_espectro = None
+                    # Factor de normalización según el tipo de dato
+                    escala = ESCALAS_WAV.get(data.dtype.type, np.float32(1.0))
                     
-                    # Si es estéreo, convertir a mono
-                    if len(self.y.shape) > 1:
-                        self.y = np.mean(self.y, axis=1)
+                    # Convertir a float32 (precisión de sobra para audio), pasar a mono
+                    # si es estéreo y normalizar, acumulando los canales directamente
+                    # en el array de salida
+                    if data.ndim == 2 and data.shape[1] == 2:
+                        self.y = np.add(data[:, 0], data[:, 1], dtype=np.float32)
+                        self.y *= escala * np.float32(0.5)
+                    elif data.ndim == 2:
+                        # Con más canales, acumularlos uno a uno sobre la salida: evita
+                        # la reducción por filas (lenta con tan pocas columnas) y no
+                        # convierte el archivo entero a float
+                        self.y = data[:, 0].astype(np.float32)
+                        for canal in range(1, data.shape[1]):
+                            np.add(self.y, data[:, canal], out=self.y)
+                        self.y *= escala / np.float32(data.shape[1])
+                    elif escala != 1.0:
+                        # Convertir y normalizar en una sola pasada
+                        self.y = np.multiply(data, escala, dtype=np.float32)
+                    else:
+                        self.y = data.astype(np.float32, copy=False)
+                    self.y = alinear(self.y)
                     
                     QMessageBox.information(None, "Cargar Audio", f"Audio cargado con éxito: {archivo_audio}")
                 except Exception as e:
@@ -120,50 +389,95 @@ class AudioProcessor:
             return None, None
 
 # Clase para reproducir audio
-class AudioPlayer:
+class AudioPlayer(QObject):
     """
     Maneja la reproducción del audio usando sounddevice.
     Implementa controles básicos como play, pause, stop y seek.
+    El stream de salida se mantiene abierto entre reproducciones: abrir el
+    dispositivo cuesta decenas de milisegundos, cambiar de buffer no.
     """
     
+    # Señales para avisar a la interfaz de que la reproducción empieza o se
+    # detiene (por pausa, stop o porque el audio llegó al final)
+    started = Signal()
+    finished = Signal()
+    
     def __init__(self):
         """
         Inicializa el reproductor con valores por defecto y 
         prepara el sistema de streaming de audio.
         """
+        super().__init__()
         self.playing = False
         self.current_position = 0
         self.audio_data = None
         self.sr = None
         self.stream = None
+        self._n = 0
+        # Protege el cambio de buffer frente al callback del hilo de audio
+        self._lock = threading.Lock()
         
+    # Método para abrir el stream de salida
+    def abrir_stream(self, sr):
+        """
+        Abre (o reabre) el stream de salida con la frecuencia de muestreo dada.
+        Solo hace falta al empezar o cuando cambia la frecuencia de muestreo.
+        """
+        self.close()
+        # Pedir baja latencia y bloques pequeños; si el dispositivo no lo
+        # admite, volver a la latencia por defecto de PortAudio
+        try:
+            self.stream = sd.OutputStream(samplerate=sr, channels=1, dtype='float32',
+                                          blocksize=512, latency='low',
+                                          callback=self.callback)
+        except sd.PortAudioError:
+            self.stream = sd.OutputStream(samplerate=sr, channels=1, dtype='float32',
+                                          blocksize=512, callback=self.callback)
+        self.sr = sr
+        self.stream.start()
+
+    # Método para cambiar el audio que se reproduce
+    def set_buffer(self, data):
+        """
+        Sustituye el audio en reproducción y vuelve al principio.
+        Lo guarda como float32 contiguo para copiarlo tal cual al stream.
+        """
+        datos = np.ascontiguousarray(data, dtype=np.float32)
+        with self._lock:
+            self.audio_data = datos
+            self._n = len(datos)
+            self.current_position = 0
+
     # Método para iniciar la reproducción
     def play(self, data, sr):
         """
         Inicia la reproducción del audio.
-        Detiene cualquier reproducción anterior si existe.
+        Sustituye cualquier reproducción anterior sin cerrar el stream.
         
         Parámetros:
         - data: datos de audio a reproducir
         - sr: frecuencia de muestreo
         """
         try:
-            # Detener reproducción anterior si existe
-            if self.stream is not None:
-                self.stop()
-            
-            self.audio_data = data
-            self.sr = sr
+            if self.stream is None or self.sr != sr:
+                self.abrir_stream(sr)
+            self.set_buffer(data)
             self.playing = True
-            self.current_position = 0
-            self.stream = sd.OutputStream(samplerate=sr, channels=1, callback=self.callback)
-            self.stream.start()
+            self.started.emit()
         except Exception as e:
             print(f"Error al iniciar reproducción: {e}")
-            self.stop()
+            self.close()
             
     # Método para detener la reproducción
     def stop(self):
+        # Bajo el lock para que un callback en curso no pise la posición
+        with self._lock:
+            self.playing = False
+            self.current_position = 0
+        self.finished.emit()
+
+    # Método para cerrar el stream de salida
+    def close(self):
         self.playing = False
         if self.stream is not None:
             try:
@@ -173,51 +487,51 @@ class AudioPlayer:
                 print(f"Error al detener stream: {e}")
             finally:
                 self.stream = None
-        self.current_position = 0
             
     # Método para pausar la reproducción
     def pause(self):
+        # El callback rellena con silencio mientras no se reproduce
         self.playing = False
-        if self.stream:
-            try:
-                self.stream.stop()
-            except Exception as e:
-                print(f"Error al pausar: {e}")
+        self.finished.emit()
             
     # Método para reanudar la reproducción
     def resume(self):
-        if self.audio_data is not None and self.stream:
-            try:
-                self.playing = True
-                self.stream.start()
-            except Exception as e:
-                print(f"Error al resumir: {e}")
-                self.stop()
+        if self.audio_data is not None and self.stream is not None:
+            self.playing = True
+            self.started.emit()
 
     # Callback para el stream de audio
     def callback(self, outdata, frames, time, status):
-        if self.playing and self.current_position < len(self.audio_data):
-            chunk = self.audio_data[self.current_position:self.current_position + frames]
-            if len(chunk) < frames:
-                outdata[:len(chunk), 0] = chunk
-                outdata[len(chunk):, 0] = 0
-                self.playing = False
+        with self._lock:
+            if self.playing and self.current_position < self._n:
+                # Copiar el bloque directamente al buffer de salida, sin reservar memoria
+                end = min(self.current_position + frames, self._n)
+                n = end - self.current_position
+                np.copyto(outdata[:n, 0], self.audio_data[self.current_position:end])
+                if n < frames:
+                    outdata[n:, 0].fill(0)
+                    self.playing = False
+                    self.finished.emit()
+                self.current_position = end
             else:
-                outdata[:, 0] = chunk
-            self.current_position += frames
-        else:
-            outdata.fill(0)
-            self.playing = False
+                outdata.fill(0)
+                if self.playing:
+                    self.playing = False
+                    self.finished.emit()
             
     # Método para buscar una posición en el audio
     def seek(self, position):
-        self.current_position = int(position * len(self.audio_data))
+        with self._lock:
+            self.current_position = int(position * self._n)
         
     # Método para obtener el progreso actual
     def get_progress(self):
-        if self.audio_data is None:
+        # _n vale 0 mientras no haya audio; se usa en vez de len() en cada tick
+        n = self._n
+        if not n:
             return 0
-        return self.current_position / len(self.audio_data) * 100
+        # Porcentaje entero; el último bloque puede dejar la posición más allá del final
+        return min(self.current_position * 100 // n, 100)
 
 # Clase principal de la interfaz gráfica
 class MainWindow(QMainWindow):
@@ -226,6 +540,10 @@ class MainWindow(QMainWindow):
     Integra todos los componentes y maneja la interfaz gráfica.
     """
     
+    # Señal para entregar en el hilo de la interfaz el resultado de una tarea
+    # ejecutada en segundo plano: (función que lo procesa, futuro)
+    tarea_terminada = Signal(object, object)
+    
     def __init__(self):
         """
         Configura la interfaz gráfica principal.
@@ -241,8 +559,18 @@ class MainWindow(QMainWindow):
         self.processor = AudioProcessor()
         self.audio_player = AudioPlayer()
         self.y_filtrado = None
+        self.sr_filtrado = None
         self.y_comprimido = None
         self.currently_playing = None
+        self._ax_comprimida = None
+        self._ax_audio = None
+        self._linea_audio = None
+        self._buffer_guardado = np.empty(0, dtype=np.float32)
+
+        # Pool de hilos para el procesamiento FFT, fuera del hilo de la interfaz
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._tareas_pendientes = 0
+        self.tarea_terminada.connect(self.entregar_resultado)
 
         # Obtener el tamaño de la pantalla
         screen = QApplication.primaryScreen().geometry()
@@ -379,6 +707,11 @@ class MainWindow(QMainWindow):
         self.seek_slider.sliderReleased.connect(self.on_slider_released)
         self.seek_slider.sliderMoved.connect(self.on_slider_moved)
         self.slider_pressed = False
+        self._ultima_posicion = -1
+        self._ultimo_progreso = -1
+        self._ultimo_segundo = -1
+        self._total_ms = 0
+        self._tiempo_total = "0:00"
         
         self.time_label = QLabel("0:00 / 0:00")
         self.time_label.setAlignment(Qt.AlignRight)
@@ -421,10 +754,17 @@ class MainWindow(QMainWindow):
         right_layout = QVBoxLayout(right_panel)
         
         # Configuración de matplotlib
-        self.figure = Figure(facecolor='white')
+        # constrained_layout ajusta los márgenes en cada dibujado, sin tight_layout
+        self.figure = Figure(facecolor='white', constrained_layout=True)
         self.canvas = FigureCanvas(self.figure)
         right_layout.addWidget(self.canvas)
         
+        # Temporizador para redibujar una sola vez al terminar de redimensionar
+        self._timer_redimension = QTimer(self)
+        self._timer_redimension.setSingleShot(True)
+        self._timer_redimension.setInterval(100)
+        self._timer_redimension.timeout.connect(self.canvas.draw_idle)
+        
         # Botón de guardar
         self.save_button = QPushButton(" Guardar")
         self.save_button.setIcon(QIcon("icons/save.png"))
@@ -451,9 +791,6 @@ class MainWindow(QMainWindow):
         button_size = int(min(width, height) * 0.05)  # 5% del menor lado
         self.play_pause_button.setFixedSize(button_size, button_size)
         
-        # Ajustar el tamaño de la figura de matplotlib
-        self.figure.set_size_inches(width/100, height/100)
-        
         # Hacer que el canvas se ajuste al contenedor
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
@@ -465,10 +802,12 @@ class MainWindow(QMainWindow):
         boton_compresion.clicked.connect(self.aplicar_compresion)
         self.save_button.clicked.connect(self.guardar_audio_actual)
 
-        # Timer para actualizar progreso
+        # Timer para actualizar progreso; solo corre mientras se reproduce
         self.timer = QTimer()
+        self.timer.setInterval(100)
         self.timer.timeout.connect(self.update_progress)
-        self.timer.start(100)
+        self.audio_player.started.connect(self.timer.start)
+        self.audio_player.finished.connect(self.on_playback_finished)
 
     # Método para graficar audio
     def plot_audio(self, data, title):
@@ -481,14 +820,27 @@ class MainWindow(QMainWindow):
         - title: título de la gráfica
         """
         """Método para graficar en el panel derecho"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.plot(data, color='#333333')
+        # Unos dos puntos por píxel de ancho del canvas
+        puntos = 2 * self.canvas.get_width_height()[0]
+        x, y = decimar_para_grafica(data, objetivo=puntos)
+        
+        # Reutilizar los ejes y la línea mientras sigan en la figura;
+        # la vista de compresión limpia la figura y obliga a recrearlos
+        ax = self._ax_audio
+        if ax is None or ax not in self.figure.axes:
+            self.figure.clear()
+            ax = self.figure.add_subplot(111)
+            self._linea_audio, = ax.plot(x, y, color='#333333')
+            ax.set_xlabel('Muestras')
+            ax.set_ylabel('Amplitud')
+            ax.grid(True, linestyle='--', alpha=0.7)
+            self._ax_audio = ax
+        else:
+            self._linea_audio.set_data(x, y)
+            ax.relim()
+            ax.autoscale_view()
         ax.set_title(title)
-        ax.set_xlabel('Muestras')
-        ax.set_ylabel('Amplitud')
-        ax.grid(True, linestyle='--', alpha=0.7)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
         # Actualizar el botón de guardar según el tipo de audio
         if "Sintetizado" in title:
@@ -505,7 +857,8 @@ class MainWindow(QMainWindow):
     def guardar_audio_actual(self):
         if hasattr(self, 'ultimo_audio_procesado'):
             self.preguntar_guardar(self.ultimo_audio_procesado, 
-                                 self.save_button.text().replace(" Guardar ", ""))
+                                 self.save_button.text().replace(" Guardar ", ""),
+                                 self.sr_procesado)
 
     # Método para alternar reproducción/pausa
     def toggle_play_pause(self):
@@ -532,25 +885,48 @@ class MainWindow(QMainWindow):
         self.audio_player.seek(position)
         if self.audio_player.playing:
             self.audio_player.resume()
+        # En pausa el temporizador está parado: refrescar la barra aquí
+        self.update_progress()
 
     def on_slider_moved(self, position):
         if self.audio_player.audio_data is not None:
-            total_time = len(self.audio_player.audio_data) / self.audio_player.sr
-            current_time = position * total_time / 100
-            self.time_label.setText(f"{int(current_time//60)}:{int(current_time%60):02d} / "
-                                  f"{int(total_time//60)}:{int(total_time%60):02d}")
+            # Duración en ms calculada al empezar la reproducción: solo aritmética entera
+            current_time = position * self._total_ms // 100000
+            self.time_label.setText(f"{formatear_tiempo(current_time)} / {self._tiempo_total}")
+            # La etiqueta ya no muestra la posición de reproducción
+            self._ultimo_segundo = -1
+            self._ultima_posicion = -1
 
     # Método para actualizar la barra de progreso
     def update_progress(self):
+        """
+        Actualiza la barra, el slider y la etiqueta de tiempo.
+        Solo toca los widgets cuando su valor cambia: la barra cuando cambia
+        el porcentaje entero y la etiqueta cuando cambia el segundo mostrado.
+        """
         if self.audio_player.audio_data is not None and not self.slider_pressed:
+            # Leer la posición una sola vez, el hilo de audio la modifica en paralelo
+            posicion = self.audio_player.current_position
+            if posicion == self._ultima_posicion:
+                return
+            self._ultima_posicion = posicion
+            
             progress = self.audio_player.get_progress()
-            self.progress_bar.setValue(int(progress))
-            self.seek_slider.setValue(int(progress))
+            if progress != self._ultimo_progreso:
+                self._ultimo_progreso = progress
+                self.progress_bar.setValue(progress)
+                self.seek_slider.setValue(progress)
             
-            current_time = self.audio_player.current_position / self.audio_player.sr
-            total_time = len(self.audio_player.audio_data) / self.audio_player.sr
-            self.time_label.setText(f"{int(current_time//60)}:{int(current_time%60):02d} / "
-                                  f"{int(total_time//60)}:{int(total_time%60):02d}")
+            segundo = posicion // self.audio_player.sr
+            if segundo != self._ultimo_segundo:
+                self._ultimo_segundo = segundo
+                self.time_label.setText(f"{formatear_tiempo(segundo)} / {self._tiempo_total}")
+
+    # Método para detener el timer cuando termina la reproducción
+    def on_playback_finished(self):
+        self.timer.stop()
+        # Último refresco para que el progreso refleje dónde se detuvo
+        self.update_progress()
 
     # Método para guardar audio
     def guardar_audio(self):
@@ -567,12 +943,26 @@ class MainWindow(QMainWindow):
         
         if archivo_guardar:
             try:
-                audio_normalizado = np.int16(self.ultimo_audio_procesado * 32767)
-                wavfile.write(archivo_guardar, self.processor.sr, audio_normalizado)
+                audio_normalizado = self.convertir_a_int16(self.ultimo_audio_procesado)
+                wavfile.write(archivo_guardar, self.sr_procesado, audio_normalizado)
                 QMessageBox.information(self, "Éxito", "Audio guardado correctamente")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error al guardar el archivo: {str(e)}")
 
+    # Método para convertir audio en coma flotante a int16
+    def convertir_a_int16(self, audio):
+        """
+        Escala el audio a int16 recortando los valores fuera de [-1, 1]
+        para evitar que las muestras desborden y den la vuelta.
+        Reutiliza un buffer intermedio entre guardados.
+        """
+        if len(self._buffer_guardado) < len(audio):
+            self._buffer_guardado = np.empty(len(audio), dtype=np.float32)
+        buffer = self._buffer_guardado[:len(audio)]
+        np.multiply(audio, 32767.0, out=buffer)
+        np.clip(buffer, -32768, 32767, out=buffer)
+        return buffer.astype(np.int16)
+
     # Método para reproducir audio
     def reproducir_audio(self, datos, sr):
         try:
@@ -584,6 +974,13 @@ class MainWindow(QMainWindow):
                 self.audio_player.play(datos, sr)
                 self.play_pause_button.setText(self.PAUSE_SYMBOL)
                 self.currently_playing = datos
+                # La duración total solo cambia con el audio: calcularla una vez
+                self._total_ms = 1000 * len(datos) // sr
+                self._tiempo_total = formatear_tiempo(self._total_ms // 1000)
+                # Forzar que el próximo tick redibuje el progreso del audio nuevo
+                self._ultima_posicion = -1
+                self._ultimo_progreso = -1
+                self._ultimo_segundo = -1
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error al reproducir: {str(e)}")
 
@@ -599,10 +996,10 @@ class MainWindow(QMainWindow):
         if self.y_filtrado is None:
             QMessageBox.critical(self, "Error", "Por favor, aplica un filtro primero")
             return
-        self.reproducir_audio(self.y_filtrado, self.processor.sr)
+        self.reproducir_audio(self.y_filtrado, self.sr_filtrado)
 
     # Método para preguntar si guardar audio
-    def preguntar_guardar(self, audio_modificado, titulo):
+    def preguntar_guardar(self, audio_modificado, titulo, sr):
         respuesta = QMessageBox.question(
             self,
             "Guardar Audio",
@@ -620,8 +1017,8 @@ class MainWindow(QMainWindow):
             
             if archivo_guardar:
                 try:
-                    audio_normalizado = np.int16(audio_modificado * 32767)
-                    wavfile.write(archivo_guardar, self.processor.sr, audio_normalizado)
+                    audio_normalizado = self.convertir_a_int16(audio_modificado)
+                    wavfile.write(archivo_guardar, sr, audio_normalizado)
                     QMessageBox.information(self, "Éxito", f"{titulo} guardado correctamente")
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Error al guardar el archivo: {str(e)}")
@@ -637,11 +1034,24 @@ class MainWindow(QMainWindow):
                 self.audio_player.stop()
                 self.play_pause_button.setText("▶")
                 
-            self.y_filtrado = filtrar_ruido(self.processor.y, self.processor.sr)
+            # Filtrar en segundo plano la señal que había al pulsar, junto con su sr
+            y, sr = self.processor.y, self.processor.sr
+            filtrar = self.processor.filtrar
+            self.ejecutar_en_segundo_plano(self.mostrar_filtrado,
+                                           lambda: (filtrar(y, sr), sr))
+                
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error al filtrar: {str(e)}")
+
+    # Método para mostrar el resultado del filtrado
+    def mostrar_filtrado(self, futuro):
+        try:
+            self.y_filtrado, self.sr_filtrado = futuro.result()
             if self.y_filtrado is not None:
                 self.plot_audio(self.y_filtrado, "Audio Filtrado")
-                self.reproducir_audio(self.y_filtrado, self.processor.sr)
+                self.reproducir_audio(self.y_filtrado, self.sr_filtrado)
                 self.ultimo_audio_procesado = self.y_filtrado
+                self.sr_procesado = self.sr_filtrado
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error al filtrar: {str(e)}")
@@ -653,12 +1063,22 @@ class MainWindow(QMainWindow):
                 self.audio_player.stop()
                 self.play_pause_button.setText(self.PLAY_SYMBOL)
                 
-            y_sintetizado, sr_sintetizado = sintetizar_sonido(frecuencia=440)
+            self.ejecutar_en_segundo_plano(self.mostrar_sintesis,
+                                           lambda: sintetizar_sonido(frecuencia=440))
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error en síntesis: {str(e)}")
+
+    # Método para mostrar el sonido sintetizado
+    def mostrar_sintesis(self, futuro):
+        try:
+            y_sintetizado, sr_sintetizado = futuro.result()
             
             # Usar el método plot_audio para mostrar en la ventana principal
             self.plot_audio(y_sintetizado, "Sonido Sintetizado (440Hz)")
             self.reproducir_audio(y_sintetizado, sr_sintetizado)
             self.ultimo_audio_procesado = y_sintetizado
+            self.sr_procesado = sr_sintetizado
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error en síntesis: {str(e)}")
@@ -673,53 +1093,87 @@ class MainWindow(QMainWindow):
                 self.audio_player.stop()
                 self.play_pause_button.setText(self.PLAY_SYMBOL)
                 
-            # Calcular FFT y aplicar compresión
-            fft_data = fft(self.processor.y)
-            frecuencias = fftfreq(len(self.processor.y), 1/self.processor.sr)
+            # Calcular FFT y aplicar compresión en segundo plano, siempre sobre
+            # la señal que había al pulsar (no la que esté cargada al ejecutarse)
+            y, sr = self.processor.y, self.processor.sr
+            espectro = self.processor.espectro
+            self.ejecutar_en_segundo_plano(
+                self.mostrar_espectros_compresion,
+                lambda: (y, sr, espectro_comprimido(y, sr, 50, espectro=espectro(y)))
+            )
             
-            # Aplicar compresión
-            umbral = int(len(fft_data) * 50 / 100)
-            fft_comprimido = fft_data.copy()
-            fft_comprimido[umbral:-umbral] = 0
-            y_comprimido = ifft(fft_comprimido).real
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error en compresión: {str(e)}")
+
+    # Método para mostrar los espectros de la compresión
+    def mostrar_espectros_compresion(self, futuro):
+        """
+        Dibuja los espectros y la señal original en cuanto están listos y
+        encarga la transformada inversa en segundo plano; la señal
+        comprimida se añade después en mostrar_compresion.
+        """
+        try:
+            # La tarea devuelve también la señal y la frecuencia de muestreo que
+            # usó: puede haberse cargado otro archivo mientras se calculaba
+            y, sr, (frecuencias, magnitud, magnitud_comprimida, fft_comprimido) = futuro.result()
             
             # Mostrar en la ventana principal
             self.figure.clear()
             
             # Crear subplots en la figura principal
-            gs = self.figure.add_gridspec(2, 2)
-            ax1 = self.figure.add_subplot(gs[0, 0])
-            ax2 = self.figure.add_subplot(gs[0, 1])
-            ax3 = self.figure.add_subplot(gs[1, 0])
-            ax4 = self.figure.add_subplot(gs[1, 1])
+            (ax1, ax2), (ax3, ax4) = self.figure.subplots(2, 2)
             
-            # Graficar espectros y señales
-            ax1.plot(frecuencias[:len(frecuencias)//2], np.abs(fft_data)[:len(frecuencias)//2])
+            # Graficar espectros y señales (cada panel ocupa la mitad del ancho)
+            puntos = self.canvas.get_width_height()[0]
+            ax1.plot(*decimar_para_grafica(magnitud, frecuencias, puntos))
             ax1.set_title("Espectro Original")
             ax1.set_xlabel("Frecuencia (Hz)")
             ax1.set_ylabel("Magnitud")
             
-            ax2.plot(frecuencias[:len(frecuencias)//2], np.abs(fft_comprimido)[:len(frecuencias)//2])
+            ax2.plot(*decimar_para_grafica(magnitud_comprimida, frecuencias, puntos))
             ax2.set_title("Espectro Comprimido")
             ax2.set_xlabel("Frecuencia (Hz)")
             ax2.set_ylabel("Magnitud")
             
-            ax3.plot(self.processor.y)
+            ax3.plot(*decimar_para_grafica(y, objetivo=puntos))
             ax3.set_title("Señal Original")
             ax3.set_xlabel("Muestras")
             ax3.set_ylabel("Amplitud")
             
-            ax4.plot(y_comprimido)
             ax4.set_title("Señal Comprimida")
             ax4.set_xlabel("Muestras")
             ax4.set_ylabel("Amplitud")
+            self._ax_comprimida = ax4
             
-            self.figure.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
+            
+            # Reconstruir la señal comprimida mientras se ven los espectros
+            longitud = len(y)
+            self.ejecutar_en_segundo_plano(
+                self.mostrar_compresion,
+                lambda: (reconstruir_senal(fft_comprimido, longitud), sr)
+            )
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error en compresión: {str(e)}")
+
+    # Método para mostrar el resultado de la compresión
+    def mostrar_compresion(self, futuro):
+        try:
+            y_comprimido, sr = futuro.result()
+            
+            # Si mientras tanto otra acción redibujó la figura, descartar el resultado
+            ax4 = self._ax_comprimida
+            if ax4 not in self.figure.axes:
+                return
+            puntos = self.canvas.get_width_height()[0]
+            ax4.plot(*decimar_para_grafica(y_comprimido, objetivo=puntos))
+            self.canvas.draw_idle()
             
             # Reproducir y preparar para guardar
-            self.reproducir_audio(y_comprimido, self.processor.sr)
+            self.reproducir_audio(y_comprimido, sr)
             self.ultimo_audio_procesado = y_comprimido
+            self.sr_procesado = sr
             
             # Actualizar el botón de guardar
             self.save_button.setText("Guardar Audio Comprimido")
@@ -728,13 +1182,38 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error en compresión: {str(e)}")
 
+    # Método para ejecutar procesamiento pesado fuera del hilo de la interfaz
+    def ejecutar_en_segundo_plano(self, al_terminar, funcion):
+        """
+        Ejecuta funcion() en el pool de hilos y, cuando termina, llama a
+        al_terminar(futuro) en el hilo de la interfaz a través de la señal
+        tarea_terminada. Las FFT de scipy liberan el GIL, así que la interfaz
+        sigue respondiendo mientras se procesa.
+        """
+        # Mientras haya tareas en curso la barra de progreso queda en modo ocupado
+        self._tareas_pendientes += 1
+        if self._tareas_pendientes == 1:
+            self.progress_bar.setRange(0, 0)
+        futuro = self._executor.submit(funcion)
+        futuro.add_done_callback(lambda f: self.tarea_terminada.emit(al_terminar, f))
+
+    # Método que recibe en el hilo de la interfaz el resultado de una tarea
+    def entregar_resultado(self, al_terminar, futuro):
+        self._tareas_pendientes -= 1
+        if self._tareas_pendientes == 0:
+            self.progress_bar.setRange(0, 100)
+            self._ultimo_progreso = -1
+        if not futuro.cancelled():
+            al_terminar(futuro)
+
     # Método para manejar el cierre de la aplicación
     def closeEvent(self, event):
         try:
             if self.audio_player:
-                self.audio_player.stop()
+                self.audio_player.close()
             if hasattr(self, 'timer'):
                 self.timer.stop()
+            self._executor.shutdown(wait=False, cancel_futures=True)
         except Exception as e:
             print(f"Error al cerrar: {e}")
         event.accept()
@@ -745,6 +1224,10 @@ class MainWindow(QMainWindow):
         if y is not None and sr is not None:
             self.plot_audio(y, "Audio Original")
             self.ultimo_audio_procesado = y
+            self.sr_procesado = sr
+            # Calcular ya el espectro en segundo plano para que el primer
+            # filtrado o compresión no tenga que esperar a la FFT directa
+            self._executor.submit(self.processor.espectro)
 
     def resizeEvent(self, event):
         """Manejar el redimensionamiento de la ventana"""
@@ -758,8 +1241,9 @@ class MainWindow(QMainWindow):
         button_size = int(min(width, height) * 0.05)
         self.play_pause_button.setFixedSize(button_size, button_size)
         
-        # Redibujar el canvas de matplotlib
-        self.canvas.draw()
+        # Redibujar el canvas de matplotlib cuando pasen 100 ms sin más cambios
+        # de tamaño; cada evento reinicia el temporizador
+        self._timer_redimension.start()
 
 # Punto de entrada de la aplicación
 if __name__ == '__main__':